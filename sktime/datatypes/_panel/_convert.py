@@ -187,6 +187,80 @@ def from_3d_numpy_to_2d_array_adp(obj, store=None):
 convert_dict[("numpy3D", "numpyflat", "Panel")] = from_3d_numpy_to_2d_array_adp
 
 
+def _panel_to_soa(X):
+    """Repack a nested panel from array-of-structs to struct-of-arrays layout.
+
+    A nested DataFrame stores each cell as an independent array object, so
+    iterating cells jumps between unrelated heap allocations. This helper
+    copies all cells into one contiguous 3D block, which downstream
+    conversions can traverse with strided access over a single buffer.
+
+    Parameters
+    ----------
+    X : pd.DataFrame
+        Nested pandas DataFrame
+
+    Returns
+    -------
+    out : 3D np.ndarray of shape [n_instances, n_columns, n_timepoints],
+        or None if the conversion does not apply (unequal lengths,
+        non-nested cells, or incompatible dtypes)
+    """
+    n_rows, n_cols = X.shape
+    if n_rows == 0 or n_cols == 0:
+        return None
+
+    first = X.iloc[0, 0]
+    if not _cell_is_series_or_array(first):
+        return None
+    length = len(first)
+    # all cells must share the first cell's dtype; stacking into the
+    # preallocated block would otherwise silently cast, where the general
+    # paths upcast to the common dtype
+    dtype = first.dtype
+
+    out = np.empty((n_rows, n_cols, length), dtype=np.asarray(first).dtype)
+    for c in range(n_cols):
+        cells = X.iloc[:, c].to_numpy()
+        if any(
+            not _cell_is_series_or_array(cell)
+            or len(cell) != length
+            or cell.dtype != dtype
+            for cell in cells
+        ):
+            return None
+        try:
+            np.stack([np.asarray(cell) for cell in cells], out=out[:, c, :])
+        except (ValueError, TypeError):
+            return None
+    return out
+
+
+def _from_nested_to_2d_block(X):
+    """Equal-length fast path for `from_nested_to_2d_array`, or None.
+
+    For nested DataFrames whose cells are all Series/arrays of one common
+    length, the tabular result is a flat view of the contiguous 3D block
+    produced by `_panel_to_soa`, one copy per cell, without intermediate
+    per-column lists.
+
+    Parameters
+    ----------
+    X : pd.DataFrame
+        Nested pandas DataFrame
+
+    Returns
+    -------
+    Xt : 2D np.ndarray of shape [n_instances, n_columns * n_timepoints],
+        or None if the fast path does not apply (unequal lengths,
+        non-nested cells, or incompatible dtypes)
+    """
+    out = _panel_to_soa(X)
+    if out is None:
+        return None
+    return out.reshape(X.shape[0], -1)
+
+
 def from_nested_to_2d_array(X, return_numpy=False):
     """Convert nested Panel to 2D numpy Panel.
 
@@ -217,19 +291,22 @@ def from_nested_to_2d_array(X, return_numpy=False):
         Xt = np.array(X.tolist())
 
     elif isinstance(X, pd.DataFrame):
-        try:
-            Xt = np.hstack([X.iloc[:, i].tolist() for i in range(X.shape[1])])
-
-        # except strange key error for specific case
-        except KeyError:
-            if (X.shape == (1, 1)) and (X.iloc[0, 0].shape == (1,)):
-                # in fact only breaks when an additional condition is met,
-                # namely that the index of the time series of a single value
-                # does not start with 0, e.g. pd.RangeIndex(9, 10) as is the
-                # case in forecasting
-                Xt = X.iloc[0, 0].values
-            else:
-                raise
+        # fast path for equal-length cells, falls back to np.hstack otherwise
+        Xt = _from_nested_to_2d_block(X)
+        if Xt is None:
+            try:
+                Xt = np.hstack([X.iloc[:, i].tolist() for i in range(X.shape[1])])
+
+            # except strange key error for specific case
+            except KeyError:
+                if (X.shape == (1, 1)) and (X.iloc[0, 0].shape == (1,)):
+                    # in fact only breaks when an additional condition is met,
+                    # namely that the index of the time series of a single value
+                    # does not start with 0, e.g. pd.RangeIndex(9, 10) as is the
+                    # case in forecasting
+                    Xt = X.iloc[0, 0].values
+                else:
+                    raise
 
         if Xt.ndim != 2:
             raise ValueError(
@@ -330,6 +407,10 @@ def from_2d_array_to_nested(
 
     if time_index is None:
         time_index = np.arange(n_timepoints)
+    # coerce once, so all nested cells share the same Index object by
+    # reference instead of pandas rebuilding an Index per instance
+    if not cells_as_numpy:
+        time_index = pd.Index(time_index)
     kwargs = {"index": time_index}
 
     Xt = pd.DataFrame(
@@ -875,11 +956,14 @@ def from_nested_to_3d_numpy(X):
 
     # If all the columns are nested in structure
     if nested_col_mask.count(True) == len(nested_col_mask):
-        X_3d = np.stack(
-            X.applymap(_convert_series_cell_to_numpy)
-            .apply(lambda row: np.stack(row), axis=1)
-            .to_numpy()
-        )
+        # fast path: repack equal-length cells into one contiguous block
+        X_3d = _panel_to_soa(X)
+        if X_3d is None:
+            X_3d = np.stack(
+                X.applymap(_convert_series_cell_to_numpy)
+                .apply(lambda row: np.stack(row), axis=1)
+                .to_numpy()
+            )
 
     # If some columns are primitive (non-nested) then first convert to
     # multi-indexed DataFrame where the same value of these columns is
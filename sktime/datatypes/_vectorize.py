@@ -12,11 +12,36 @@ import itertools
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 
 from sktime.datatypes._check import check_is_scitype, mtype
 from sktime.datatypes._convert import convert_to
 from sktime.utils.multiindex import flatten_multiindex
 
+# sklearn estimators whose fit/transform are NumPy/BLAS-bound and release the
+# GIL, so the threading backend parallelizes them without pickling overhead
+_GIL_FREE_ESTIMATORS = {
+    "StandardScaler",
+    "MinMaxScaler",
+    "MaxAbsScaler",
+    "RobustScaler",
+    "Normalizer",
+    "PCA",
+    "FastICA",
+    "TruncatedSVD",
+}
+
+
+def _resolve_backend(estimator):
+    """Pick a joblib backend suited to `estimator`, helper for vectorize_est.
+
+    Returns "threading" if the estimator declares a `_releases_gil=True`
+    attribute or is a known GIL-releasing sklearn estimator, else "loky".
+    """
+    releases_gil = getattr(estimator, "_releases_gil", False)
+    releases_gil = releases_gil or type(estimator).__name__ in _GIL_FREE_ESTIMATORS
+    return "threading" if releases_gil else "loky"
+
 
 class VectorizedDF:
     """Wrapper for easy vectorization/iteration over instances.
@@ -446,6 +471,8 @@ class VectorizedDF:
         rowname_default="estimators",
         colname_default="estimators",
         varname_of_self=None,
+        n_jobs=None,
+        backend=None,
         **kwargs,
     ):
         """Vectorize application of estimator method, return results DataFrame or list.
@@ -505,6 +532,23 @@ class VectorizedDF:
             used as index name of single column if no column vectorization is performed
         varname_of_self : str, optional, default=None
             if not None, self will be passed as kwarg under name "varname_of_self"
+        n_jobs : int, optional, default=None
+            if not None, the method calls are dispatched through
+            `joblib.Parallel` with `n_jobs` jobs; the vectorized applications
+            are independent of each other, so this parallelizes over
+            rows/columns. If None, calls are executed sequentially.
+        backend : str, optional, default=None
+            joblib backend to use if `n_jobs` is not None, e.g., "loky" for
+            process-based parallelism or "threading" for GIL-releasing,
+            NumPy/BLAS-bound estimator methods.
+            If None, the backend is selected automatically: "threading" if
+            `estimator` is a DataFrame of per-slice estimators and these
+            declare `_releases_gil=True` or are known GIL-releasing sklearn
+            estimators, otherwise "loky". A broadcast single `estimator`
+            always auto-selects "loky", since all tasks share that one
+            instance and mutating methods such as "fit" are not thread-safe
+            on a shared instance; passing "threading" explicitly with a
+            broadcast estimator and a mutating `method` is unsafe
         kwargs : will be passed to invoked methods of estimator(s) in `estimator`
 
         Returns
@@ -514,6 +558,10 @@ class VectorizedDF:
           will be `rowname_default` resp `colname_default`.
           Entries are identity references to entries of `estimator`,
           after `method` executed with arguments as above.
+          The identity guarantee holds only for sequential execution and the
+          "threading" backend; with `n_jobs` set and a process-based backend
+          such as "loky", entries are unpickled copies of the entries of
+          `estimator`, with `method` executed in a worker process.
         """
         if args is None:
             args = kwargs
@@ -569,7 +617,7 @@ class VectorizedDF:
         else:
             estimators = itertools.cycle([estimator])
 
-        ret = []
+        tasks = []
 
         for ((group_name, col_name, group), args_i, args_i_rowvec, est_i) in zip(
             self.items(),
@@ -582,15 +630,38 @@ class VectorizedDF:
             if varname_of_self is not None:
                 args_i[varname_of_self] = group
 
-            est_i_method = getattr(est_i, method)
-            est_i_result = est_i_method(**args_i)
-
             if group_name is None:
                 group_name = rowname_default
             if col_name is None:
                 col_name = colname_default
 
-            ret.append((group_name, col_name, est_i_result))
+            tasks.append((group_name, col_name, est_i, args_i))
+
+        if n_jobs is None:
+            results = [
+                getattr(est_i, method)(**args_i) for _, _, est_i, args_i in tasks
+            ]
+        else:
+            if backend is None:
+                if isinstance(estimator, pd.DataFrame):
+                    backend = _resolve_backend(estimator.iloc[0, 0])
+                else:
+                    # a broadcast single estimator is shared between all tasks;
+                    # under "threading", worker threads would concurrently
+                    # mutate that one instance for stateful methods such as
+                    # "fit", so only process-based parallelism is safe here
+                    backend = "loky"
+            # batch_size="auto" lets joblib batch small tasks to amortize
+            # pickling and dispatch overhead
+            results = Parallel(n_jobs=n_jobs, backend=backend, batch_size="auto")(
+                delayed(getattr(est_i, method))(**args_i)
+                for _, _, est_i, args_i in tasks
+            )
+
+        ret = [
+            (group_name, col_name, result)
+            for (group_name, col_name, _, _), result in zip(tasks, results)
+        ]
 
         if return_type == "pd.DataFrame":
             df = pd.DataFrame(ret).pivot(index=0, columns=1, values=2)
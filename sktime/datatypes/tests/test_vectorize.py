@@ -473,3 +473,53 @@ def test_vectorize_est(
     assert result.shape == (n_rows, n_cols)
     is_fcst_frame = result.applymap(lambda x: isinstance(x, NaiveForecaster))
     assert is_fcst_frame.all().all()
+
+
+@pytest.mark.parametrize("backend", ["loky", "threading"])
+def test_vectorize_est_parallel(scitype, mtype, fixture_index, backend):
+    """Tests that parallel vectorize_est returns the same results as sequential.
+
+    Fixtures parameterized
+    ----------------------
+    scitype : str - scitype of fixture
+    mtype : str - mtype of fixture
+    fixture_index : int - index of fixture tuple with that scitype and mtype
+    backend : str - joblib backend used for the parallel run
+
+    Raises
+    ------
+    RuntimeError if scitype is not defined or has no mtypes or examples
+    AssertionError if parallel results differ from sequential results
+    exception if vectorize_est produces error
+    """
+    from sktime.forecasting.naive import NaiveForecaster
+
+    # retrieve fixture for checking
+    fixture = get_examples(mtype=mtype, as_scitype=scitype).get(fixture_index)
+    X_vect = VectorizedDF(X=fixture, iterate_as="Series", is_scitype=None)
+
+    def fit_predict(n_jobs=None):
+        est_clones = X_vect.vectorize_est(NaiveForecaster(), method="clone")
+        fitted = X_vect.vectorize_est(
+            est_clones,
+            method="fit",
+            y=X_vect,
+            fh=[1, 2],
+            n_jobs=n_jobs,
+            backend=backend,
+        )
+        return X_vect.vectorize_est(
+            fitted,
+            method="predict",
+            fh=[1, 2],
+            n_jobs=n_jobs,
+            backend=backend,
+            return_type="list",
+        )
+
+    preds_seq = fit_predict()
+    preds_par = fit_predict(n_jobs=2)
+
+    assert len(preds_seq) == len(preds_par)
+    for pred_seq, pred_par in zip(preds_seq, preds_par):
+        assert deep_equals(pred_seq, pred_par)
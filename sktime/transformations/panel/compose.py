@@ -8,16 +8,24 @@ transformations as building blocks.
 __author__ = ["mloning", "sajaysurya", "fkiraly"]
 __all__ = ["ColumnTransformer", "ColumnConcatenator"]
 
+from itertools import chain
 from warnings import warn
 
 import numpy as np
 import pandas as pd
+from sklearn.base import clone
 from sklearn.compose import ColumnTransformer as _ColumnTransformer
 
 from sktime.transformations.base import BaseTransformer, _PanelToPanelTransformer
+from sktime.transformations.panel.reduce import _iter_instance_chunks
 from sktime.utils.multiindex import flatten_multiindex
 from sktime.utils.validation.panel import check_X
 
+# density above which stacked sparse output is densified in _hstack:
+# above roughly 10% non-zeros, the dense result is both smaller in memory
+# and faster downstream, since dense dot products hit BLAS
+_DENSE_STACK_DENSITY = 0.1
+
 
 class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
     """Column-wise application of transformers.
@@ -83,6 +91,18 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
     preserve_dataframe : boolean
         If True, pandas dataframe is returned.
         If False, numpy array is returned.
+    parallel_columns : boolean, default=True
+        If True, transformers that set a `_column_parallel=True` attribute and
+        are assigned a list of more than one column are split into one
+        per-column task per assigned column before fitting. Each task gets its
+        own clone of the transformer, so the joblib dispatch controlled by
+        `n_jobs` balances load across columns instead of serializing all
+        columns of one transformer in a single task.
+    check_input : boolean, default=True
+        If False, input validation and coercion via check_X is skipped in
+        `fit` and `transform`. Only set to False when the caller already
+        guarantees a valid nested pd.DataFrame, e.g., when composing several
+        sktime transformers that would otherwise re-validate the same data.
 
 
     Attributes
@@ -106,6 +126,9 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         Boolean flag indicating wether the output of ``transform`` is a
         sparse matrix or a dense numpy array, which depends on the output
         of the individual transformations and the `sparse_threshold` keyword.
+        Even if True, ``transform`` returns a dense array whenever the
+        actual density of the stacked output at transform time exceeds 0.1,
+        since dense output is then smaller and faster downstream.
     """
 
     _tags = {"python_dependencies": "scipy"}
@@ -118,6 +141,8 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         n_jobs=1,
         transformer_weights=None,
         preserve_dataframe=True,
+        parallel_columns=True,
+        check_input=True,
     ):
 
         warn(
@@ -139,8 +164,34 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         )
         BaseTransformer.__init__(self)
         self.preserve_dataframe = preserve_dataframe
+        self.parallel_columns = parallel_columns
+        self.check_input = check_input
         self._is_fitted = False
 
+    def _expand_transformers(self):
+        """Split opt-in transformers into one task per assigned column.
+
+        Returns a copy of `self.transformers` where entries whose transformer
+        has a `_column_parallel=True` attribute and more than one assigned
+        column are replaced by per-column entries with cloned transformers.
+        Idempotent: expanded entries have a single column and pass through.
+        """
+        expanded = []
+        for name, trans, cols in self.transformers:
+            splittable = (
+                self.parallel_columns
+                and getattr(trans, "_column_parallel", False)
+                and isinstance(cols, (list, tuple))
+                and len(cols) > 1
+            )
+            if splittable:
+                # "__" is reserved by sklearn for set_params paths
+                for i, col in enumerate(cols):
+                    expanded.append((f"{name}_{i}", clone(trans), [col]))
+            else:
+                expanded.append((name, trans, cols))
+        return expanded
+
     def _hstack(self, Xs):
         """
         Stacks X horizontally.
@@ -148,17 +199,43 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
         Supports input types (X): list of numpy arrays, sparse arrays and
         DataFrames
         """
-        types = set(type(X) for X in Xs)
-
         if self.sparse_output_:
             from scipy import sparse
 
-            return sparse.hstack(Xs).tocsr()
-        if self.preserve_dataframe and (pd.Series in types or pd.DataFrame in types):
-            vars = [y for x in self.transformers for y in x[2]]
+            # sparse_output_ is decided once at fit time; re-check the actual
+            # density of the stacked output and densify above the threshold
+            nnz = sum(x.nnz if sparse.issparse(x) else np.asarray(x).size for x in Xs)
+            total = sum(x.shape[0] * x.shape[1] for x in Xs)
+            if total > 0 and nnz / total > _DENSE_STACK_DENSITY:
+                return np.hstack([x.toarray() if sparse.issparse(x) else x for x in Xs])
+            # requesting csr directly avoids the intermediate COO allocation
+            # that hstack(...).tocsr() would copy and sort
+            return sparse.hstack(Xs, format="csr")
+        # single isinstance pass with early exit, instead of materializing a
+        # set of the types of all outputs
+        if self.preserve_dataframe and any(
+            isinstance(x, (pd.Series, pd.DataFrame)) for x in Xs
+        ):
+            transformers = getattr(self, "_transformers_expanded", self.transformers)
+            vars = [y for x in transformers for y in x[2]]
             vars_unique = len(set(vars)) == len(vars)
-            names = [str(x[0]) for x in self.transformers]
+            names = [str(x[0]) for x in transformers]
             if vars_unique:
+                # fast path: with all inputs DataFrames of one dtype sharing
+                # the same index, pd.concat only pays for index alignment;
+                # concatenate the underlying arrays directly instead
+                if (
+                    all(isinstance(x, pd.DataFrame) for x in Xs)
+                    and len(set(dt for x in Xs for dt in x.dtypes)) == 1
+                    and all(x.index.equals(Xs[0].index) for x in Xs[1:])
+                ):
+                    cols = list(chain.from_iterable(x.columns for x in Xs))
+                    return pd.DataFrame(
+                        np.concatenate([x.values for x in Xs], axis=1),
+                        index=Xs[0].index,
+                        columns=cols,
+                        copy=False,
+                    )
                 return pd.concat(Xs, axis="columns")
             else:
                 Xt = pd.concat(Xs, axis="columns", keys=names)
@@ -174,9 +251,13 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
 
         Output can also be a pd.Series which is actually a 1D
         """
-        names = [
-            name for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
-        ]
+        # transformer names are cached after fit, since _iter rebuilds the
+        # same list on every transform call otherwise
+        names = getattr(self, "_cached_iter_names", None)
+        if names is None:
+            names = [
+                name for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
+            ]
         for Xs, name in zip(result, names):
             if not (getattr(Xs, "ndim", 0) == 2 or isinstance(Xs, pd.Series)):
                 raise ValueError(
@@ -209,7 +290,8 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
 
     def fit(self, X, y=None):
         """Fit the transformer."""
-        X = check_X(X, coerce_to_pandas=True)
+        if self.check_input:
+            X = check_X(X, coerce_to_pandas=True)
         super(ColumnTransformer, self).fit(X, y)
         self._is_fitted = True
         return self
@@ -217,16 +299,39 @@ class ColumnTransformer(_ColumnTransformer, _PanelToPanelTransformer):
     def transform(self, X, y=None):
         """Transform the data."""
         self.check_is_fitted()
-        X = check_X(X, coerce_to_pandas=True)
+        if self.check_input:
+            X = check_X(X, coerce_to_pandas=True)
         return super(ColumnTransformer, self).transform(X)
 
     def fit_transform(self, X, y=None):
         """Fit and transform, shorthand."""
-        # Wrap fit_transform to set _is_fitted attribute
-        Xt = super(ColumnTransformer, self).fit_transform(X, y)
+        # Wrap fit_transform to set _is_fitted attribute.
+        # Drop the cached transformer names of any previous fit before the
+        # parent call: _validate_output runs inside super().fit_transform,
+        # and a stale cache would silently truncate validation on refits
+        # after direct mutation of self.transformers
+        self._cached_iter_names = None
+        # The hyper-parameter self.transformers is swapped for its per-column
+        # expansion only for the duration of the parent call, so that
+        # get_params/clone still see the original specification.
+        transformers_orig = self.transformers
+        self._transformers_expanded = self._expand_transformers()
+        self.transformers = self._transformers_expanded
+        try:
+            Xt = super(ColumnTransformer, self).fit_transform(X, y)
+        finally:
+            self.transformers = transformers_orig
+        self._cached_iter_names = tuple(
+            name for name, _, _, _ in self._iter(fitted=True, replace_strings=True)
+        )
         self._is_fitted = True
         return Xt
 
+    def set_params(self, **kwargs):
+        """Set the parameters of this estimator, invalidating fitted caches."""
+        self._cached_iter_names = None
+        return super(ColumnTransformer, self).set_params(**kwargs)
+
 
 class ColumnConcatenator(BaseTransformer):
     """Concatenate multivariate series to a long univariate series.
@@ -277,6 +382,51 @@ class ColumnConcatenator(BaseTransformer):
         "fit_is_empty": True,  # is fit empty and can be skipped? Yes = True
     }
 
+    def _transform_equal_length(self, X):
+        """Equal-length fast path for _transform, or None.
+
+        If all instances of a 2-level-indexed panel have the same number of
+        timepoints, concatenation in time is a contiguous reshape of the
+        values block: (n_instances * n_timepoints, n_columns) is reordered
+        to one long series per instance without the stack/sort round-trip.
+
+        Parameters
+        ----------
+        X : pd.DataFrame with MultiIndex
+
+        Returns
+        -------
+        Xt : pd.DataFrame as returned by _transform,
+            or None if the fast path does not apply
+        """
+        if X.index.nlevels != 2 or not X.columns.is_unique:
+            return None
+        sizes = X.groupby(level=0).size()
+        if sizes.nunique() != 1:
+            return None
+        # the general path drops missing entries when stacking
+        if X.isna().to_numpy().any():
+            return None
+        try:
+            Xs = X.sort_index().sort_index(axis=1)
+        except TypeError:
+            return None
+
+        n_instances = sizes.shape[0]
+        n_columns = X.shape[1]
+        n_timepoints = int(sizes.iloc[0])
+
+        values = np.ascontiguousarray(
+            Xs.to_numpy()
+            .reshape(n_instances, n_timepoints, n_columns)
+            .transpose(0, 2, 1)
+        ).reshape(n_instances * n_columns * n_timepoints)
+
+        inst_idx = np.repeat(sizes.index.to_numpy(), n_columns * n_timepoints)
+        t_idx = np.tile(np.arange(n_columns * n_timepoints), n_instances)
+        index = pd.MultiIndex.from_arrays([inst_idx, t_idx], names=X.index.names)
+        return pd.DataFrame(values, index=index, columns=[0])
+
     def _transform(self, X, y=None):
         """Transform the data.
 
@@ -295,15 +445,45 @@ class ColumnConcatenator(BaseTransformer):
           Transformed pandas DataFrame with same number of rows and single
           column
         """
+        Xt = self._transform_equal_length(X)
+        if Xt is not None:
+            return Xt
+
         Xst = pd.DataFrame(X.stack())
         Xt = Xst.swaplevel(-2, -1).sort_index().droplevel(-2)
 
         # the above has the right structure, but the wrong indes
         # the time index is in general non-unique now, we replace it by integer index
         inst_idx = Xt.index.get_level_values(0)
-        t_idx = [range(len(Xt.loc[x])) for x in inst_idx.unique()]
-        t_idx = np.concatenate(t_idx)
+        # per-instance ranges, computed by vectorized run-length arithmetic:
+        # Xt is sorted, so instances form contiguous runs and the within-run
+        # position is the global position minus the run start offset
+        counts = Xt.groupby(level=0, sort=False).size().to_numpy()
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        t_idx = np.arange(len(inst_idx)) - starts
 
         Xt.index = pd.MultiIndex.from_arrays([inst_idx, t_idx])
         Xt.index.names = X.index.names
         return Xt
+
+    def iter_transform(self, X, chunk_size):
+        """Transform X lazily, in chunks of instances.
+
+        Generator counterpart of `transform` for panels too large to
+        materialize the full transformed output: X is split into consecutive
+        chunks of at most `chunk_size` instances, and each chunk is
+        transformed and yielded separately. Concatenating all chunks yields
+        the same rows as `transform(X)`.
+
+        Parameters
+        ----------
+        X : panel of time series, in a format accepted by transform
+        chunk_size : int
+            number of instances per transformed chunk
+
+        Yields
+        ------
+        transformed chunks of X, as returned by transform
+        """
+        for chunk in _iter_instance_chunks(X, chunk_size):
+            yield self.transform(chunk)
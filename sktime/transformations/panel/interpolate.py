@@ -71,6 +71,31 @@ class TSInterpolator(BaseTransformer):
         Xt = f(np.linspace(0, 1, self.length))
         return pd.Series(Xt)
 
+    def _resize_col(self, col):
+        """Resize all cells of a nested column in one interpolation call.
+
+        Stacks the cell series of `col` into a single 2D array and fits one
+        vectorized interp1d over the last axis, instead of one scipy call
+        (plus one Series construction) per cell. Requires all cells in the
+        column to have equal length.
+
+        Parameters
+        ----------
+        col : pd.Series with array-like entries, all of equal length
+
+        Returns
+        -------
+        pd.Series : nested column with resized pd.Series in cells
+        """
+        from scipy import interpolate
+
+        arr = np.stack([np.asarray(cell) for cell in col])
+        f = interpolate.interp1d(np.linspace(0, 1, arr.shape[1]), arr, axis=-1)
+        arr_t = f(np.linspace(0, 1, self.length))
+        return pd.Series(
+            [pd.Series(row) for row in arr_t], index=col.index, name=col.name
+        )
+
     def _transform(self, X, y=None):
         """Take series in each cell, train linear interpolation and samples n.
 
@@ -85,7 +110,24 @@ class TSInterpolator(BaseTransformer):
         pandas DataFrame : Transformed pandas DataFrame of shape [n_samples, n_features]
             follows nested_univ format
         """
-        return X.applymap(self._resize_cell)
+        cols_t = []
+        for colname in X.columns:
+            col = X[colname]
+            # fast path: equal-length cells can be resized in one batch call,
+            # fall back to cell-wise interpolation for unequal lengths
+            if len(set(len(cell) for cell in col)) == 1:
+                cols_t.append(self._resize_col(col))
+            else:
+                # build the nested column explicitly: Series.apply would expand
+                # the pd.Series cells returned by _resize_cell into a wide frame
+                cols_t.append(
+                    pd.Series(
+                        [self._resize_cell(cell) for cell in col],
+                        index=col.index,
+                        name=colname,
+                    )
+                )
+        return pd.concat(cols_t, axis=1)
 
     @classmethod
     def get_test_params(cls):
@@ -67,11 +67,6 @@ class PaddingTransformer(BaseTransformer):
 
         return self
 
-    def _create_pad(self, series):
-        out = np.full(self.pad_length_, self.fill_value, float)
-        out[: len(series)] = series.iloc[: len(series)]
-        return out
-
     def _transform(self, X, y=None):
         """Transform X and return a transformed version.
 
@@ -91,7 +86,7 @@ class PaddingTransformer(BaseTransformer):
             each cell of Xt contains pandas.Series
             transformed version of X
         """
-        n_instances, _ = X.shape
+        n_instances, n_columns = X.shape
 
         arr = [X.iloc[i, :].values for i in range(n_instances)]
 
@@ -103,8 +98,16 @@ class PaddingTransformer(BaseTransformer):
                     is greater than the one found when fit or set."
             )
 
-        pad = [pd.Series([self._create_pad(series) for series in out]) for out in arr]
-        Xt = pd.DataFrame(pad).applymap(pd.Series)
+        # pad all cells of a column into one preallocated buffer and wrap its
+        # rows as Series, instead of allocating one padded array and
+        # constructing two pandas objects per cell
+        cols_t = []
+        for c in range(n_columns):
+            buf = np.full((n_instances, self.pad_length_), self.fill_value, float)
+            for i, series in enumerate(X.iloc[:, c]):
+                buf[i, : len(series)] = np.asarray(series)
+            cols_t.append(pd.Series([pd.Series(row) for row in buf]))
+        Xt = pd.concat(cols_t, axis=1)
 
         return Xt
 
@@ -14,6 +14,43 @@ from sktime.datatypes import convert, convert_to
 from sktime.transformations.base import BaseTransformer
 
 
+def _iter_instance_chunks(X, chunk_size):
+    """Yield consecutive instance-wise chunks of a panel, helper function.
+
+    Parameters
+    ----------
+    X : panel of time series
+        3D np.ndarray, or pd.DataFrame with flat index (nested/tabular rows)
+        or MultiIndex (instances in the first level)
+    chunk_size : int
+        number of instances per chunk
+
+    Yields
+    ------
+    chunks of X of at most `chunk_size` instances, same type as X
+    """
+    if not isinstance(chunk_size, (int, np.integer)) or chunk_size < 1:
+        raise ValueError(
+            f"chunk_size must be a positive integer, but found: {chunk_size}"
+        )
+
+    if isinstance(X, pd.DataFrame) and isinstance(X.index, pd.MultiIndex):
+        inst_idx = X.index.get_level_values(0)
+        instances = inst_idx.unique()
+        for i in range(0, len(instances), chunk_size):
+            yield X.loc[inst_idx.isin(instances[i : i + chunk_size])]
+    elif isinstance(X, (pd.DataFrame, pd.Series)):
+        for i in range(0, X.shape[0], chunk_size):
+            yield X.iloc[i : i + chunk_size]
+    elif isinstance(X, np.ndarray):
+        for i in range(0, X.shape[0], chunk_size):
+            yield X[i : i + chunk_size]
+    else:
+        raise TypeError(
+            f"Expected np.ndarray, pd.Series or pd.DataFrame, but found: {type(X)}"
+        )
+
+
 class Tabularizer(BaseTransformer):
     """
     A transformer that turns time series/panel data into tabular data.
@@ -73,6 +110,28 @@ class Tabularizer(BaseTransformer):
         Xt = convert(X, from_type="numpyflat", to_type="numpy3D", as_scitype="Panel")
         return Xt
 
+    def iter_transform(self, X, chunk_size):
+        """Transform X lazily, in chunks of instances.
+
+        Generator counterpart of `transform` for panels too large to
+        materialize the full transformed output: X is split into consecutive
+        chunks of at most `chunk_size` instances, and each chunk is
+        transformed and yielded separately. Concatenating all chunks yields
+        the same rows as `transform(X)`.
+
+        Parameters
+        ----------
+        X : panel of time series, in a format accepted by transform
+        chunk_size : int
+            number of instances per transformed chunk
+
+        Yields
+        ------
+        transformed chunks of X, as returned by transform
+        """
+        for chunk in _iter_instance_chunks(X, chunk_size):
+            yield self.transform(chunk)
+
 
 class TimeBinner(BaseTransformer):
     """Turns time series/panel data into tabular data based on intervals.
@@ -1,15 +1,23 @@
 # -*- coding: utf-8 -*-
 """Tests for panel compositors."""
 import numpy as np
+import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import FunctionTransformer
 
 from sktime.datasets import load_basic_motions
-from sktime.transformations.panel.compose import ColumnTransformer
+from sktime.datatypes._panel._convert import from_nested_to_3d_numpy
+from sktime.transformations.panel.compose import ColumnConcatenator, ColumnTransformer
 from sktime.transformations.panel.reduce import Tabularizer
 
 
+class _ColumnParallelIdentity(FunctionTransformer):
+    """Identity FunctionTransformer opting in to per-column expansion."""
+
+    _column_parallel = True
+
+
 def test_ColumnTransformer_pipeline():
     """Test pipeline with ColumnTransformer."""
     X_train, y_train = load_basic_motions(split="train", return_X_y=True)
@@ -35,3 +43,92 @@ def test_ColumnTransformer_pipeline():
     y_pred = model.predict(X_test)
     assert y_pred.shape[0] == y_test.shape[0]
     np.testing.assert_array_equal(np.unique(y_pred), np.unique(y_test))
+
+
+def test_ColumnTransformer_expands_column_parallel_transformers():
+    """Test per-column expansion of transformers with _column_parallel=True."""
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+    X = X.iloc[:10]
+    cols = ["dim_0", "dim_1"]
+
+    def id_func(X):
+        return X
+
+    def make_ct(parallel_columns):
+        return ColumnTransformer(
+            [("id", _ColumnParallelIdentity(func=id_func, validate=False), cols)],
+            parallel_columns=parallel_columns,
+        )
+
+    ct = make_ct(parallel_columns=True)
+    Xt = ct.fit_transform(X)
+
+    # the fitted transformers are the per-column expansion, one clone per
+    # assigned column, while the hyper-parameter keeps the original spec
+    fitted_names = [name for name, _, _ in ct.transformers_]
+    assert "id_0" in fitted_names
+    assert "id_1" in fitted_names
+    assert "id" not in fitted_names
+    assert [name for name, _, _ in ct.transformers] == ["id"]
+
+    # transform after fit agrees with fit_transform
+    np.testing.assert_array_equal(
+        from_nested_to_3d_numpy(Xt), from_nested_to_3d_numpy(ct.transform(X))
+    )
+
+    # values equal the unexpanded result
+    Xt_seq = make_ct(parallel_columns=False).fit_transform(X)
+    np.testing.assert_array_equal(
+        from_nested_to_3d_numpy(Xt), from_nested_to_3d_numpy(Xt_seq)
+    )
+
+
+def test_ColumnTransformer_sparse_density_stacking():
+    """Test the density-based densify-vs-CSR decision in _hstack."""
+    from scipy import sparse
+
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+    X = X.iloc[:10]
+
+    def sparse_func(density):
+        def func(X):
+            arr = np.zeros((X.shape[0], 50))
+            arr[:, : int(50 * density)] = 1.0
+            return sparse.csr_matrix(arr)
+
+        return func
+
+    def make_ct(density):
+        trafo = FunctionTransformer(func=sparse_func(density), validate=False)
+        return ColumnTransformer([("sp", trafo, ["dim_0"])], preserve_dataframe=False)
+
+    # density below _DENSE_STACK_DENSITY: stacked output stays sparse csr
+    ct = make_ct(density=0.04)
+    Xt = ct.fit_transform(X)
+    assert ct.sparse_output_
+    assert sparse.issparse(Xt)
+    assert Xt.format == "csr"
+    np.testing.assert_array_equal(Xt.toarray()[:, :2], 1.0)
+
+    # density above _DENSE_STACK_DENSITY: densified despite sparse_output_
+    ct = make_ct(density=0.2)
+    Xt = ct.fit_transform(X)
+    assert ct.sparse_output_
+    assert isinstance(Xt, np.ndarray)
+    np.testing.assert_array_equal(Xt[:, :10], 1.0)
+
+
+def test_iter_transform_equals_transform():
+    """Test that concatenated iter_transform chunks equal full transform."""
+    X_train, _ = load_basic_motions(split="train", return_X_y=True)
+    X = X_train.iloc[:10]
+
+    tabularizer = Tabularizer().fit(X)
+    Xt_full = tabularizer.transform(X)
+    Xt_chunked = np.concatenate(list(tabularizer.iter_transform(X, chunk_size=3)))
+    np.testing.assert_array_equal(Xt_full, Xt_chunked)
+
+    concatenator = ColumnConcatenator().fit(X)
+    Xt_full = concatenator.transform(X)
+    Xt_chunked = pd.concat(list(concatenator.iter_transform(X, chunk_size=3)))
+    pd.testing.assert_frame_equal(Xt_full, Xt_chunked)
@@ -49,3 +49,36 @@ def test_resizing():
     #       that we set above
     ts_lens_after_resize = [len(Xt.iloc[0][i]) for i in range(len(Xt.iloc[0]))]
     assert all([length == target_len for length in ts_lens_after_resize])
+
+
+def test_resizing_unequal_length_within_column():
+    """Test TSInterpolator on columns with unequal cell lengths.
+
+    Cutting lengths per row makes cells within a single column unequal in
+    length, which takes the cell-wise fallback path of _transform rather
+    than the batched equal-length fast path. The result must still be a
+    nested DataFrame with all cells resized to the target length.
+    """
+    X, _ = load_basic_motions(split="train", return_X_y=True)
+    X = X.iloc[:5]
+
+    # cut each time series by its row index, so lengths differ within columns
+    arr = X.values
+    for row_i in range(X.shape[0]):
+        for dim_i in range(X.shape[1]):
+            ts = X.iloc[row_i, dim_i]
+            arr[row_i, dim_i] = pd.Series(ts.tolist()[: len(ts) - row_i - 1])
+    X = pd.DataFrame(arr, index=X.index, columns=X.columns)
+
+    col_lens = [len(X.iloc[row_i, 0]) for row_i in range(X.shape[0])]
+    assert len(set(col_lens)) > 1  # lengths within a column are different
+
+    target_len = 50
+    Xt = TSInterpolator(target_len).fit_transform(X)
+
+    assert isinstance(Xt, pd.DataFrame)
+    for row_i in range(Xt.shape[0]):
+        for dim_i in range(Xt.shape[1]):
+            cell = Xt.iloc[row_i, dim_i]
+            assert isinstance(cell, pd.Series)
+            assert len(cell) == target_len
@@ -64,6 +64,13 @@ class TabularToSeriesAdaptor(BaseTransformer):
     transformer : Estimator
         scikit-learn-like transformer to fit and apply to series.
         This is used as a "blueprint" and not fitted or otherwise mutated.
+    stateless : bool, optional, default=False
+        If True, the wrapped transformer is treated as stateless: nothing it
+        learns in fit influences transform. fit is skipped entirely, and
+        transform/inverse_transform call the wrapped transformer's methods
+        directly, without the per-call re-fit that fit_in_transform performs.
+        The wrapped transformer must support transform without a prior fit
+        call, e.g., sklearn's FunctionTransformer.
 
     Attributes
     ----------
@@ -97,10 +104,11 @@ class TabularToSeriesAdaptor(BaseTransformer):
         "fit_is_empty": False,
     }
 
-    def __init__(self, transformer, fit_in_transform=False):
+    def __init__(self, transformer, fit_in_transform=False, stateless=False):
         self.transformer = transformer
         self.transformer_ = clone(self.transformer)
         self.fit_in_transform = fit_in_transform
+        self.stateless = stateless
 
         super(TabularToSeriesAdaptor, self).__init__()
 
@@ -113,7 +121,7 @@ class TabularToSeriesAdaptor(BaseTransformer):
         else:
             trafo_fit_in_transform = False
 
-        self._skip_fit = fit_in_transform or trafo_fit_in_transform
+        self._skip_fit = fit_in_transform or trafo_fit_in_transform or stateless
 
         if self._skip_fit:
             self.set_tags(**{"fit_is_empty": True})
@@ -155,7 +163,10 @@ class TabularToSeriesAdaptor(BaseTransformer):
         Xt : 2D np.ndarray
             transformed version of X
         """
-        if self._skip_fit:
+        if self.stateless:
+            # no state to learn, so skip the per-call re-fit entirely
+            Xt = self.transformer_.transform(X)
+        elif self._skip_fit:
             Xt = self.transformer_.fit(X).transform(X)
         else:
             Xt = self.transformer_.transform(X)
@@ -187,7 +198,9 @@ class TabularToSeriesAdaptor(BaseTransformer):
         Xt : 2D np.ndarray
             inverse transformed version of X
         """
-        if self.fit_in_transform:
+        if self.stateless:
+            Xt = self.transformer_.inverse_transform(X)
+        elif self.fit_in_transform:
             Xt = self.transformer_.fit(X).inverse_transform(X)
         else:
             Xt = self.transformer_.inverse_transform(X)
@@ -211,12 +224,13 @@ class TabularToSeriesAdaptor(BaseTransformer):
             `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
             `create_test_instance` uses the first (or only) dictionary in `params`
         """
-        from sklearn.preprocessing import StandardScaler
+        from sklearn.preprocessing import FunctionTransformer, StandardScaler
 
         params1 = {"transformer": StandardScaler(), "fit_in_transform": False}
         params2 = {"transformer": StandardScaler(), "fit_in_transform": True}
+        params3 = {"transformer": FunctionTransformer(), "stateless": True}
 
-        return [params1, params2]
+        return [params1, params2, params3]
 
 
 class PandasTransformAdaptor(BaseTransformer):